@@ -116,3 +116,89 @@ def jwt_auth(login: str, token: str, conf: dict) -> bool:
 
     logging.error("Wrong auth for %s: Returned False", login)
     return False  # we should never reach this one
+
+
+def _warmup_keys(algorithm: str, conf: dict) -> tuple:
+    """return the (signing key, verifying key) used for the warm-up token
+
+    HMAC algorithms use the configured secret.
+    Asymmetric algorithms use a throwaway key pair of the configured type:
+    we only know the public key, but what we want to warm up here is the
+    cryptography backend, not the key itself.
+    """
+    if algorithm.startswith("HS"):
+        return conf.get("jwt_secret"), conf.get("jwt_secret")
+
+    # cryptography is an optional dependency of pyjwt, only needed here
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+    if algorithm.startswith("ES"):
+        curve = {"ES256": ec.SECP256R1, "ES384": ec.SECP384R1}.get(
+            algorithm, ec.SECP521R1
+        )
+        private_key = ec.generate_private_key(curve(), default_backend())
+    else:  # RS* and PS*
+        private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048, backend=default_backend()
+        )
+    return private_key, private_key.public_key()
+
+
+def jwt_warmup(conf: dict) -> bool:
+    """warm up the jwt verify path before serving the first request
+
+    Crypto backends, the pyjwt algorithm registry and the datetime machinery
+    are all initialized lazily: this runs them once at startup so the first
+    real auth does not pay for it.
+    Key parsing of the configured secrets is exercised once, then a
+    self-signed dummy token is decoded with the configured algorithm
+    (signed with the configured secret for HS* algorithms, with a throwaway
+    key pair for asymmetric ones).
+
+    :param conf: configuration loaded from config file
+
+    :return: True if the full verify path has been run, False otherwise.
+
+    As jwt_auth, this function never raises anything.
+    """
+    _leeway = 10  # same default as jwt_auth
+    algorithm = conf.get("jwt_algorithm", "HS256")
+    try:
+        algorithm_obj = jwt.algorithms.get_default_algorithms()[algorithm]
+        for secret in (conf.get("jwt_secret"), conf.get("jwt_secret_old")):
+            if secret:
+                algorithm_obj.prepare_key(secret)
+
+        signing_key, verifying_key = _warmup_keys(algorithm, conf)
+        now = datetime.datetime.utcnow()
+        payload = {
+            conf.get("user_claim", "sub"): "warmup@localhost",
+            "exp": now + datetime.timedelta(seconds=60),
+            "iat": now,
+            "nbf": now,
+        }
+        if conf.get("issuer") is not None:
+            payload["iss"] = conf.get("issuer")
+        if conf.get("audience") is not None:
+            payload["aud"] = conf.get("audience")
+        token = jwt.encode(payload, signing_key, algorithm).decode("utf-8")
+        # decode directly instead of using jwt_auth: a failed warm-up
+        # must not be logged as a failed user auth
+        jwt.decode(
+            token,
+            verifying_key,
+            issuer=conf.get("issuer"),
+            audience=conf.get("audience"),
+            leeway=datetime.timedelta(seconds=conf.get("leeway", _leeway)),
+            algorithms=[algorithm],
+        )
+        return True
+    except Exception as exc:  # catch all
+        logging.warning(
+            "Warm-up verify failed for %s: %s:%s",
+            algorithm,
+            exc.__class__.__name__,
+            exc,
+        )
+        return False
@@ -3,10 +3,11 @@ import os
 import pathlib
 import sys
 import struct
+import time
 
 import yaml
 
-from ejabberd_external_auth_jwt.auth import jwt_auth
+from ejabberd_external_auth_jwt.auth import jwt_auth, jwt_warmup
 
 CONFIG_PATH = os.environ["EJABBERD_EXTERNAL_AUTH_JWT_CONFIG_PATH"]
 
@@ -56,6 +57,15 @@ def main_sync():
     # loading conf
     conf = load_config(CONFIG_PATH)
 
+    if conf.get("warmup", True):
+        start = time.perf_counter()
+        success = jwt_warmup(conf)
+        logging.info(
+            "Warm-up done (full verify path: %s) in %.3fms",
+            success,
+            (time.perf_counter() - start) * 1000,
+        )
+
     while True:
         data = from_ejabberd()
         sys.stderr.write("### AUTH based on data: %s" % data)
@@ -5,7 +5,7 @@ import pytest
 
 import jwt
 
-from ejabberd_external_auth_jwt.auth import jwt_auth
+from ejabberd_external_auth_jwt.auth import jwt_auth, jwt_warmup
 
 
 @pytest.fixture
@@ -172,3 +172,45 @@ def test_auth_full_nok_nbf_1(conf_full, payload_full):
     payload_full["nbf"] = datetime.datetime.utcnow() + datetime.timedelta(seconds=11)
     jwt_token = jwt.encode(payload_full, "SECRET", "HS256").decode("utf-8")
     assert jwt_auth("user@domain.ext", jwt_token, conf_full) is False
+
+
+def test_warmup_simple_ok(conf_simple):
+    """warm-up runs the full verify path with a self-signed token."""
+    assert jwt_warmup(conf_simple) is True
+
+
+def test_warmup_full_ok(conf_full):
+    """warm-up runs the full verify path with all controls enabled in conf."""
+    assert jwt_warmup(conf_full) is True
+
+
+def test_warmup_empty_nok(conf_empty):
+    """warm-up cannot sign a dummy token without secret, but does not raise."""
+    assert jwt_warmup(conf_empty) is False
+
+
+def test_warmup_bad_algorithm_nok(conf_simple):
+    """warm-up with an unknown algorithm does not raise."""
+    conf_simple["jwt_algorithm"] = "BAD"
+    assert jwt_warmup(conf_simple) is False
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "PS256", "ES256", "ES512"])
+def test_warmup_asymmetric_ok(algorithm):
+    """warm-up runs the full verify path with a throwaway key pair."""
+    pytest.importorskip("cryptography")
+    assert jwt_warmup({"jwt_algorithm": algorithm}) is True
+
+
+def test_warmup_asymmetric_bad_key_nok():
+    """warm-up reports a configured public key which cannot be parsed."""
+    pytest.importorskip("cryptography")
+    conf = {"jwt_algorithm": "RS256", "jwt_secret": "not a pem key"}
+    assert jwt_warmup(conf) is False
+
+
+def test_warmup_server_side_expiration_ok(conf_full, caplog):
+    """warm-up does not log a failed user auth."""
+    conf_full["jwt_expiration"] = 0
+    assert jwt_warmup(conf_full) is True
+    assert "Wrong auth" not in caplog.text
@@ -0,0 +1,52 @@
+"""Test Main Module."""
+import os
+
+import pytest
+
+os.environ.setdefault("EJABBERD_EXTERNAL_AUTH_JWT_CONFIG_PATH", "unused.yml")
+
+from ejabberd_external_auth_jwt import main  # noqa: E402
+
+
+class StopLoop(Exception):
+    """raised by the fake ejabberd stdin to leave the read loop."""
+
+
+@pytest.fixture
+def fake_main(monkeypatch):
+    """main_sync with fake config, warm-up and ejabberd stdin.
+
+    returns the list of calls made, in order.
+    """
+    calls = []
+    conf = {"jwt_secret": "SECRET"}
+
+    def fake_jwt_warmup(conf):
+        calls.append("warmup")
+        return False
+
+    def fake_from_ejabberd():
+        calls.append("read")
+        raise StopLoop()
+
+    monkeypatch.setattr(main, "load_config", lambda fname: conf)
+    monkeypatch.setattr(main, "jwt_warmup", fake_jwt_warmup)
+    monkeypatch.setattr(main, "from_ejabberd", fake_from_ejabberd)
+    return conf, calls
+
+
+def test_main_sync_warmup(fake_main):
+    """warm-up is run before the read loop, even if it failed."""
+    conf, calls = fake_main
+    with pytest.raises(StopLoop):
+        main.main_sync()
+    assert calls == ["warmup", "read"]
+
+
+def test_main_sync_warmup_disabled(fake_main):
+    """warm-up is not run when disabled in conf."""
+    conf, calls = fake_main
+    conf["warmup"] = False
+    with pytest.raises(StopLoop):
+        main.main_sync()
+    assert calls == ["read"]